@@ -6,25 +6,9 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import (
-    BRIDGE_SER2NET,
-    CONF_CONNECTION_TYPE,
-    CONF_MODBUS_HOST,
-    CONF_MODBUS_PORT,
-    CONF_SERIAL_BAUDRATE,
-    CONF_SERIAL_PARITY,
-    CONF_SERIAL_PORT,
-    CONF_SLAVE_ID,
-    CONF_TCP_BRIDGE_TYPE,
-    DEFAULT_BAUDRATE,
-    DEFAULT_PARITY,
-    DEFAULT_TCP_PORT,
-    DEFAULT_SLAVE_ID,
-    DOMAIN,
-    PLATFORMS,
-)
+from .const import DATA_PROBED_CLIENTS, DATA_TRANSPORTS, DOMAIN, PLATFORMS
 from .coordinator import UbbinkVigorCoordinator
-from .modbus_client import UbbinkModbusClient
+from .modbus_client import ModbusTransport, UbbinkModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,39 +17,77 @@ type UbbinkVigorConfigEntry = ConfigEntry[UbbinkVigorCoordinator]
 
 async def async_setup_entry(hass: HomeAssistant, entry: UbbinkVigorConfigEntry) -> bool:
     """Set up Ubbink Vigor from a config entry."""
-    data = entry.data
-
-    client = UbbinkModbusClient(
-        connection_type=data[CONF_CONNECTION_TYPE],
-        slave_id=data.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID),
-        serial_port=data.get(CONF_SERIAL_PORT),
-        baudrate=data.get(CONF_SERIAL_BAUDRATE, DEFAULT_BAUDRATE),
-        parity=data.get(CONF_SERIAL_PARITY, DEFAULT_PARITY),
-        host=data.get(CONF_MODBUS_HOST),
-        port=data.get(CONF_MODBUS_PORT, DEFAULT_TCP_PORT),
-        bridge_type=data.get(CONF_TCP_BRIDGE_TYPE, BRIDGE_SER2NET),
-    )
-
-    connected = await client.connect()
-    if not connected:
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
+    domain_data = hass.data[DOMAIN]
+    # The config flow may have created the domain dict for a probe already
+    transports = domain_data.setdefault(DATA_TRANSPORTS, {})
+    client = UbbinkModbusClient.from_config(entry.data)
+    key = client.connection_key
+
+    # Adopt the connection the config flow just verified, if it is still open
+    probed = domain_data.get(DATA_PROBED_CLIENTS, {}).pop((key, client.slave_id), None)
+
+    # Claim the link before the first await: entries are set up concurrently,
+    # and units on the same bus must end up sharing one transport.
+    if (claim := transports.get(key)) is None:
+        if probed is not None and probed.connected:
+            claim = (probed.transport, set())
+        else:
+            claim = (client.transport, set())
+        transports[key] = claim
+    transport, users = claim
+    users.add(entry.entry_id)
+
+    if probed is not None and probed.transport is transport:
+        client = probed
+    else:
+        if probed is not None:
+            await probed.close()
+        if client.transport is not transport:
+            # Another unit on the same bus already holds the link
+            client = UbbinkModbusClient(transport, client.slave_id)
+
+    # A no-op if another entry on the link has already connected it
+    if not await client.connect():
         _LOGGER.error("Failed to connect to Ubbink Vigor")
+        await _async_release_transport(hass, entry.entry_id, client.transport)
         return False
 
     coordinator = UbbinkVigorCoordinator(hass, client)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await _async_release_transport(hass, entry.entry_id, client.transport)
+        raise
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    coordinator.serial = coordinator.data.get("serial_number", "unknown")
+    entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(
+    hass: HomeAssistant, entry: UbbinkVigorConfigEntry
+) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        coordinator: UbbinkVigorCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        await coordinator.client.close()
+        await _async_release_transport(
+            hass, entry.entry_id, entry.runtime_data.client.transport
+        )
     return unload_ok
+
+
+async def _async_release_transport(
+    hass: HomeAssistant, entry_id: str, transport: ModbusTransport
+) -> None:
+    """Drop an entry's claim on a shared link, closing it with the last user."""
+    transports = hass.data[DOMAIN][DATA_TRANSPORTS]
+    users = transports[transport.key][1]
+    users.discard(entry_id)
+    if not users:
+        del transports[transport.key]
+        await transport.close()
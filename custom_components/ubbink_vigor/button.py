@@ -2,74 +2,86 @@
 from __future__ import annotations
 
 import logging
-
-from homeassistant.components.button import ButtonDeviceClass, ButtonEntity
-from homeassistant.config_entries import ConfigEntry
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from homeassistant.components.button import (
+    ButtonDeviceClass,
+    ButtonEntity,
+    ButtonEntityDescription,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from . import UbbinkVigorConfigEntry
 from .coordinator import UbbinkVigorCoordinator
 from .entity import UbbinkVigorEntity
+from .modbus_client import UbbinkModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class UbbinkButtonDescription(ButtonEntityDescription):
+    """Describe an Ubbink button."""
+
+    press_fn: Callable[[UbbinkModbusClient], Awaitable[bool]]
+    refresh_after_press: bool = True
+
+
+BUTTON_DESCRIPTIONS: tuple[UbbinkButtonDescription, ...] = (
+    # Writes 1 to register 8010.
+    UbbinkButtonDescription(
+        key="filter_reset",
+        name="Reset Filter Warning",
+        icon="mdi:air-filter",
+        press_fn=lambda client: client.reset_filter(),
+    ),
+    # Writes 1 to register 8011. Use with caution; the unit restarts, so
+    # there is nothing useful to read back straight away.
+    UbbinkButtonDescription(
+        key="appliance_reset",
+        name="Appliance Reset",
+        icon="mdi:restart",
+        device_class=ButtonDeviceClass.RESTART,
+        entity_registry_enabled_default=False,
+        press_fn=lambda client: client.reset_appliance(),
+        refresh_after_press=False,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: UbbinkVigorConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up button entities."""
-    coordinator: UbbinkVigorCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([
-        UbbinkFilterResetButton(coordinator),
-        UbbinkApplianceResetButton(coordinator),
-    ])
-
-
-class UbbinkFilterResetButton(UbbinkVigorEntity, ButtonEntity):
-    """Button to reset the filter warning.
-
-    Writes 1 to register 8010.
-    """
-
-    _attr_name = "Reset Filter Warning"
-    _attr_icon = "mdi:air-filter"
-
-    def __init__(self, coordinator: UbbinkVigorCoordinator) -> None:
-        """Initialise."""
-        super().__init__(coordinator, "filter_reset")
-
-    async def async_press(self) -> None:
-        """Handle the button press."""
-        ok = await self.coordinator.client.reset_filter()
-        if ok:
-            _LOGGER.info("Filter warning reset sent")
-            await self.coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to reset filter warning")
-
+    coordinator = entry.runtime_data
+    async_add_entities(
+        UbbinkVigorButton(coordinator, desc) for desc in BUTTON_DESCRIPTIONS
+    )
 
-class UbbinkApplianceResetButton(UbbinkVigorEntity, ButtonEntity):
-    """Button to reset the appliance.
 
-    Writes 1 to register 8011. Use with caution.
-    """
+class UbbinkVigorButton(UbbinkVigorEntity, ButtonEntity):
+    """Button entity for Ubbink Vigor."""
 
-    _attr_name = "Appliance Reset"
-    _attr_icon = "mdi:restart"
-    _attr_device_class = ButtonDeviceClass.RESTART
-    _attr_entity_registry_enabled_default = False
+    entity_description: UbbinkButtonDescription
 
-    def __init__(self, coordinator: UbbinkVigorCoordinator) -> None:
-        """Initialise."""
-        super().__init__(coordinator, "appliance_reset")
+    def __init__(
+        self, coordinator: UbbinkVigorCoordinator, description: UbbinkButtonDescription
+    ) -> None:
+        """Initialise the button."""
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        ok = await self.coordinator.client.reset_appliance()
+        name = self.entity_description.name
+        ok = await self.entity_description.press_fn(self.coordinator.client)
         if ok:
-            _LOGGER.info("Appliance reset sent")
+            _LOGGER.info("%s sent", name)
+            if self.entity_description.refresh_after_press:
+                await self.coordinator.async_request_refresh()
         else:
-            _LOGGER.error("Failed to reset appliance")
+            _LOGGER.error("Failed to send %s", name)
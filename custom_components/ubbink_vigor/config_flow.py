@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
     BRIDGE_MBUSD,
@@ -21,81 +23,126 @@ from .const import (
     CONF_TCP_BRIDGE_TYPE,
     CONN_SERIAL,
     CONN_TCP,
+    DATA_PROBED_CLIENTS,
+    DATA_TRANSPORTS,
     DEFAULT_BAUDRATE,
     DEFAULT_PARITY,
     DEFAULT_SLAVE_ID,
     DEFAULT_TCP_PORT,
     DOMAIN,
+    PROBED_CLIENT_TTL,
 )
 from .modbus_client import UbbinkModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_CONNECTION_TYPE = vol.Schema(
+_CONN_CHOICES: Final = {
+    CONN_TCP: "TCP (via ser2net / mbusd on remote device)",
+    CONN_SERIAL: "Serial (direct USB on this machine)",
+}
+_BRIDGE_CHOICES: Final = {
+    BRIDGE_SER2NET: "ser2net (raw serial tunnel → RTU framing)",
+    BRIDGE_MBUSD: "mbusd (protocol converter → Modbus TCP framing)",
+}
+_BAUDRATE_CHOICES: Final = {
+    rate: str(rate) for rate in (1200, 2400, 4800, 9600, 19200, 38400, 56000, 115200)
+}
+_PARITY_CHOICES: Final = {"N": "None", "E": "Even", "O": "Odd"}
+
+# Shared by the TCP and serial steps
+_SLAVE_ID_VALIDATOR: Final = vol.All(int, vol.Range(min=1, max=247))
+
+STEP_CONNECTION_TYPE: Final = vol.Schema(
     {
-        vol.Required(CONF_CONNECTION_TYPE, default=CONN_TCP): vol.In(
-            {CONN_TCP: "TCP (via ser2net / mbusd on remote device)", CONN_SERIAL: "Serial (direct USB on this machine)"}
-        ),
+        vol.Required(CONF_CONNECTION_TYPE, default=CONN_TCP): vol.In(_CONN_CHOICES),
     }
 )
 
-STEP_TCP = vol.Schema(
+STEP_TCP: Final = vol.Schema(
     {
         vol.Required(CONF_MODBUS_HOST): str,
         vol.Required(CONF_MODBUS_PORT, default=DEFAULT_TCP_PORT): int,
-        vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(
-            int, vol.Range(min=1, max=247)
-        ),
+        vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): _SLAVE_ID_VALIDATOR,
         vol.Required(CONF_TCP_BRIDGE_TYPE, default=BRIDGE_SER2NET): vol.In(
-            {
-                BRIDGE_SER2NET: "ser2net (raw serial tunnel → RTU framing)",
-                BRIDGE_MBUSD: "mbusd (protocol converter → Modbus TCP framing)",
-            }
+            _BRIDGE_CHOICES
         ),
     }
 )
 
-STEP_SERIAL = vol.Schema(
+STEP_SERIAL: Final = vol.Schema(
     {
         vol.Required(CONF_SERIAL_PORT, default="/dev/ttyUSB0"): str,
         vol.Required(CONF_SERIAL_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(
-            {1200: "1200", 2400: "2400", 4800: "4800", 9600: "9600", 19200: "19200", 38400: "38400", 56000: "56000", 115200: "115200"}
+            _BAUDRATE_CHOICES
         ),
         vol.Required(CONF_SERIAL_PARITY, default=DEFAULT_PARITY): vol.In(
-            {"N": "None", "E": "Even", "O": "Odd"}
-        ),
-        vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(
-            int, vol.Range(min=1, max=247)
+            _PARITY_CHOICES
         ),
+        vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): _SLAVE_ID_VALIDATOR,
     }
 )
 
 
-async def _test_connection(hass: HomeAssistant, user_input: dict[str, Any]) -> str | None:
-    """Test the Modbus connection. Returns error string or None on success."""
-    conn_type = user_input[CONF_CONNECTION_TYPE]
-    client = UbbinkModbusClient(
-        connection_type=conn_type,
-        slave_id=user_input[CONF_SLAVE_ID],
-        serial_port=user_input.get(CONF_SERIAL_PORT),
-        baudrate=user_input.get(CONF_SERIAL_BAUDRATE, DEFAULT_BAUDRATE),
-        parity=user_input.get(CONF_SERIAL_PARITY, DEFAULT_PARITY),
-        host=user_input.get(CONF_MODBUS_HOST),
-        port=user_input.get(CONF_MODBUS_PORT, DEFAULT_TCP_PORT),
-        bridge_type=user_input.get(CONF_TCP_BRIDGE_TYPE, BRIDGE_SER2NET),
+async def _test_connection(
+    hass: HomeAssistant, user_input: dict[str, Any]
+) -> tuple[str | None, UbbinkModbusClient | None]:
+    """Test the Modbus connection.
+
+    Returns (error, None) on failure, or (None, client) on success with the
+    client still connected so setup can adopt it.
+    """
+    client = UbbinkModbusClient.from_config(user_input)
+    shared = hass.data.get(DOMAIN, {}).get(DATA_TRANSPORTS, {}).get(
+        client.connection_key
     )
+    if shared is not None:
+        # An existing entry already holds this link open; opening a second
+        # connection would be refused (or kick it off) on most bridges.
+        client = UbbinkModbusClient(shared[0], client.slave_id)
     try:
-        connected = await client.connect()
-        if not connected:
-            return "cannot_connect"
-        if not await client.test_connection():
-            return "cannot_connect"
-        return None
+        if await client.connect():
+            link_errors = client.transport.link_errors(client.slave_id)
+            if await client.test_connection():
+                return None, client
+            # An error response still proves the unit is there; some firmware
+            # rejects the probe register but answers the identity read. After
+            # a timeout, a second request would only time out as well.
+            if (
+                client.transport.link_errors(client.slave_id) == link_errors
+                and await client.read_identity() is not None
+            ):
+                return None, client
     except Exception:
         _LOGGER.exception("Connection test failed")
-        return "cannot_connect"
-    finally:
+    if shared is None:
         await client.close()
+    return "cannot_connect", None
+
+
+@callback
+def _stash_probed_client(hass: HomeAssistant, client: UbbinkModbusClient) -> None:
+    """Hand a verified connection over to async_setup_entry.
+
+    The connection is closed if setup has not claimed it within
+    PROBED_CLIENT_TTL seconds. Shared links are left alone; setup finds
+    those through the transport registry.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    shared = domain_data.get(DATA_TRANSPORTS, {}).get(client.connection_key)
+    if shared is not None and shared[0] is client.transport:
+        return
+    probed = domain_data.setdefault(DATA_PROBED_CLIENTS, {})
+    key = (client.connection_key, client.slave_id)
+    if (stale := probed.pop(key, None)) is not None:
+        hass.async_create_task(stale.close())
+    probed[key] = client
+
+    async def _expire(_now: datetime) -> None:
+        if probed.get(key) is client:
+            del probed[key]
+            await client.close()
+
+    async_call_later(hass, PROBED_CLIENT_TTL, _expire)
 
 
 class UbbinkVigorConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -127,10 +174,11 @@ class UbbinkVigorConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             self._data.update(user_input)
-            error = await _test_connection(self.hass, self._data)
+            error, client = await _test_connection(self.hass, self._data)
             if error:
                 errors["base"] = error
             else:
+                _stash_probed_client(self.hass, client)
                 title = f"Vigor ({self._data[CONF_MODBUS_HOST]}:{self._data[CONF_MODBUS_PORT]})"
                 return self.async_create_entry(title=title, data=self._data)
 
@@ -146,10 +194,11 @@ class UbbinkVigorConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             self._data.update(user_input)
-            error = await _test_connection(self.hass, self._data)
+            error, client = await _test_connection(self.hass, self._data)
             if error:
                 errors["base"] = error
             else:
+                _stash_probed_client(self.hass, client)
                 title = f"Vigor ({self._data[CONF_SERIAL_PORT]})"
                 return self.async_create_entry(title=title, data=self._data)
 
@@ -1,6 +1,8 @@
 """Constants for the Ubbink Ubiflux Vigor integration."""
 from __future__ import annotations
 
+from typing import Final
+
 DOMAIN = "ubbink_vigor"
 MANUFACTURER = "Ubbink / Brink"
 
@@ -31,6 +33,15 @@ DEFAULT_PARITY = "E"
 DEFAULT_TCP_PORT = 502
 DEFAULT_SCAN_INTERVAL = 30
 
+# hass.data[DOMAIN] key mapping each physical link to its shared transport
+# and the set of config entry IDs using it.
+DATA_TRANSPORTS = "transports"
+
+# hass.data[DOMAIN] key holding connections verified by the config flow,
+# which async_setup_entry adopts instead of opening a second one.
+DATA_PROBED_CLIENTS = "probed_clients"
+PROBED_CLIENT_TTL = 30  # seconds before an unclaimed probe connection is closed
+
 # Modbus register offsets - documentation uses absolute numbers.
 # pymodbus uses 0-based protocol addresses, but these devices use the
 # register numbers from the docs directly.
@@ -192,8 +203,6 @@ BYPASS_MODE_MAP = {
     2: "Open",
 }
 
-BYPASS_MODE_REVERSE = {v: k for k, v in BYPASS_MODE_MAP.items()}
-
 FILTER_STATUS_MAP = {
     0: "Clean",
     1: "Dirty",
@@ -221,17 +230,36 @@ PREHEATER_STATUS_MAP = {
     3: "Test Mode",
 }
 
+
+def _table(mapping: dict[int, str]) -> tuple[str | None, ...]:
+    """Flatten a small int-keyed map into a tuple indexed by raw value."""
+    return tuple(mapping.get(i) for i in range(max(mapping) + 1))
+
+
+# Tuple views of the maps above, indexed directly by the raw register value.
+# Gaps hold None; the dicts stay as the readable source of truth.
+ACTIVE_FUNCTION_TABLE = _table(ACTIVE_FUNCTION_MAP)
+VENTILATION_MODE_TABLE = _table(VENTILATION_MODE_MAP)
+BYPASS_STATUS_TABLE = _table(BYPASS_STATUS_MAP)
+BYPASS_MODE_TABLE = _table(BYPASS_MODE_MAP)
+FILTER_STATUS_TABLE = _table(FILTER_STATUS_MAP)
+SYSTEM_ERROR_TABLE = _table(SYSTEM_ERROR_MAP)
+FAN_STATUS_TABLE = _table(FAN_STATUS_MAP)
+PREHEATER_STATUS_TABLE = _table(PREHEATER_STATUS_MAP)
+
+BYPASS_MODE_REVERSE: Final = {
+    name: value for value, name in enumerate(BYPASS_MODE_TABLE) if name is not None
+}
+
 AIRFLOW_MODE_OPTIONS = ["wall_unit", "holiday", "low", "normal", "high"]
 BYPASS_MODE_OPTIONS = ["Automatic", "Closed", "Open"]
 
-# Switch position mapping for remote control register 8001
-AIRFLOW_MODE_TO_SWITCH = {
-    "holiday": 0,
-    "low": 1,
-    "normal": 2,
-    "high": 3,
-}
+# Switch position mapping for remote control register 8001, indexed by the
+# raw switch value.
+AIRFLOW_MODES_BY_SWITCH: Final = ("holiday", "low", "normal", "high")
+
+AIRFLOW_MODE_TO_SWITCH = {mode: i for i, mode in enumerate(AIRFLOW_MODES_BY_SWITCH)}
 
-SWITCH_TO_AIRFLOW_MODE = {v: k for k, v in AIRFLOW_MODE_TO_SWITCH.items()}
+SWITCH_TO_AIRFLOW_MODE = dict(enumerate(AIRFLOW_MODES_BY_SWITCH))
 
-PLATFORMS: list[str] = ["sensor", "select", "number", "button"]
+PLATFORMS: Final[tuple[str, ...]] = ("sensor", "select", "number", "button")
@@ -6,6 +6,7 @@ from datetime import timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
@@ -18,6 +19,13 @@ _LOGGER = logging.getLogger(__name__)
 MAX_FAILURES_BEFORE_BACKOFF = 3
 BACKOFF_INTERVAL = 120  # seconds
 
+# Refreshes requested after writes wait this long, so a burst of writes
+# (e.g. dragging a slider) is confirmed by one poll instead of one each.
+REFRESH_COOLDOWN = 2.0  # seconds
+
+_NORMAL_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+_BACKOFF_INTERVAL = timedelta(seconds=BACKOFF_INTERVAL)
+
 
 class UbbinkVigorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage data fetching from the Vigor unit."""
@@ -28,48 +36,60 @@ class UbbinkVigorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=_NORMAL_INTERVAL,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.client = client
+        # Resolved once after the first refresh; shared by all entities
+        self.serial = "unknown"
         self._consecutive_failures = 0
+        self._in_backoff = False
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the Vigor unit."""
         # Reconnect if needed (TCP dropped, Pi Zero rebooted, etc.)
-        if not self.client.connected:
-            _LOGGER.debug("Modbus client disconnected, attempting reconnect")
-            connected = await self.client.connect()
-            if not connected:
-                self._consecutive_failures += 1
-                self._maybe_backoff()
-                raise UpdateFailed(
-                    "Cannot connect to Ubbink Vigor – check bridge device"
-                )
+        if not await self.client.ensure_connected():
+            self._consecutive_failures += 1
+            self._maybe_backoff()
+            raise UpdateFailed(
+                "Cannot connect to Ubbink Vigor – check bridge device"
+            )
 
         data = await self.client.read_all_data()
         if data is None:
             self._consecutive_failures += 1
             self._maybe_backoff()
-            # Try to reconnect on next cycle
-            await self.client.close()
+            # Keep the connection; the next cycle probes it before reconnecting
             raise UpdateFailed("Failed to read data from Ubbink Vigor")
 
         # Successful read – reset failure counter and restore normal interval
-        if self._consecutive_failures > 0:
+        if self._consecutive_failures:
             _LOGGER.info("Ubbink Vigor communication restored")
             self._consecutive_failures = 0
-            self.update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+            if self._in_backoff:
+                self._in_backoff = False
+                self.update_interval = _NORMAL_INTERVAL
 
         return data
 
+    async def async_apply_write(self, values: dict[str, Any]) -> None:
+        """Show the result of a successful write, then confirm it by polling."""
+        if self.data is not None:
+            self.data.update(values)
+        self.async_update_listeners()
+        await self.async_request_refresh()
+
     def _maybe_backoff(self) -> None:
         """Slow down polling after repeated failures."""
         if self._consecutive_failures >= MAX_FAILURES_BEFORE_BACKOFF:
-            if self.update_interval != timedelta(seconds=BACKOFF_INTERVAL):
+            if not self._in_backoff:
+                self._in_backoff = True
                 _LOGGER.warning(
                     "Ubbink Vigor unreachable after %s attempts, "
                     "backing off to %ss poll interval",
                     self._consecutive_failures,
                     BACKOFF_INTERVAL,
                 )
-                self.update_interval = timedelta(seconds=BACKOFF_INTERVAL)
+                self.update_interval = _BACKOFF_INTERVAL
@@ -1,6 +1,8 @@
 """Base entity for Ubbink Vigor."""
 from __future__ import annotations
 
+import sys
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -16,18 +18,17 @@ class UbbinkVigorEntity(CoordinatorEntity[UbbinkVigorCoordinator]):
     def __init__(self, coordinator: UbbinkVigorCoordinator, key: str) -> None:
         """Initialise the entity."""
         super().__init__(coordinator)
-        serial = coordinator.data.get("serial_number", "unknown")
-        self._attr_unique_id = f"{serial}_{key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        serial = self.coordinator.data.get("serial_number", "unknown")
-        return DeviceInfo(
-            identifiers={(DOMAIN, serial)},
+        # The serial is resolved once on first refresh and never changes, so
+        # the device info can be built once instead of on every access.
+        self._serial = coordinator.serial
+        # Keys are source literals and already interned; the composed ID is
+        # built at runtime, so intern it to share one copy with the registry.
+        self._attr_unique_id = sys.intern(f"{self._serial}_{key}")
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._serial)},
             name="Ubbink Vigor",
             manufacturer=MANUFACTURER,
             model="Ubiflux Vigor W400",
-            serial_number=serial,
+            serial_number=self._serial,
             sw_version=None,
         )
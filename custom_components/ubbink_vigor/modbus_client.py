@@ -3,6 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import struct
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from contextlib import suppress
+from functools import partial
 from typing import Any
 
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
@@ -10,6 +14,14 @@ from pymodbus.exceptions import ModbusException
 from pymodbus.framer import FramerType
 
 from .const import (
+    CONF_CONNECTION_TYPE,
+    CONF_MODBUS_HOST,
+    CONF_MODBUS_PORT,
+    CONF_SERIAL_BAUDRATE,
+    CONF_SERIAL_PARITY,
+    CONF_SERIAL_PORT,
+    CONF_SLAVE_ID,
+    CONF_TCP_BRIDGE_TYPE,
     CONN_SERIAL,
     CONN_TCP,
     BRIDGE_SER2NET,
@@ -19,6 +31,7 @@ from .const import (
     DEFAULT_SLAVE_ID,
     DEFAULT_TCP_PORT,
     # Input registers
+    REG_SW_VERSION_TYPE,
     REG_SERIAL_0,
     REG_ACTIVE_FUNCTION,
     REG_VENTILATION_MODE,
@@ -39,7 +52,7 @@ from .const import (
     REG_FROST_STATUS,
     REG_FROST_HEATER_POWER,
     REG_FROST_FAN_REDUCTION,
-    REG_OUTSIDE_TEMP,
+    REG_FLOW_SWITCH_POSITION,
     REG_DWELLING_TEMP,
     REG_RHT_HUMIDITY,
     REG_FILTER_STATUS,
@@ -59,39 +72,112 @@ from .const import (
     REG_FILTER_WARNING_DAYS,
     # Remote control
     REG_MODBUS_CONTROL,
-    REG_SWITCH_POSITION,
     REG_DESIRED_FLOW_RATE,
     REG_STANDBY,
     REG_FILTER_RESET,
     REG_APPLIANCE_RESET,
     # Maps
-    ACTIVE_FUNCTION_MAP,
-    VENTILATION_MODE_MAP,
-    BYPASS_STATUS_MAP,
-    BYPASS_MODE_MAP,
-    FILTER_STATUS_MAP,
-    SYSTEM_ERROR_MAP,
-    FAN_STATUS_MAP,
-    PREHEATER_STATUS_MAP,
+    ACTIVE_FUNCTION_TABLE,
+    VENTILATION_MODE_TABLE,
+    BYPASS_STATUS_TABLE,
+    BYPASS_MODE_TABLE,
+    BYPASS_MODE_REVERSE,
+    FILTER_STATUS_TABLE,
+    SYSTEM_ERROR_TABLE,
+    FAN_STATUS_TABLE,
+    PREHEATER_STATUS_TABLE,
     AIRFLOW_MODE_TO_SWITCH,
-    SWITCH_TO_AIRFLOW_MODE,
+    AIRFLOW_MODES_BY_SWITCH,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Minimum delay between Modbus operations (seconds).
+# Gap between serialised Modbus operations (seconds).
 # The Vigor devices can be slow to respond; rapid-fire requests may cause
-# the device to drop frames or return errors.
-MIN_REQUEST_DELAY = 0.15
+# the device to drop frames or return errors. The gap adapts per link:
+# it doubles on every failed request (up to the maximum) and shrinks by
+# one step after a streak of successful ones (down to the minimum).
+INITIAL_REQUEST_DELAY = 0.05
+MIN_REQUEST_DELAY = 0.02
+MAX_REQUEST_DELAY = 0.5
+REQUEST_DELAY_STEP = 0.005
+REQUEST_DELAY_STREAK = 20
 
+# Requests waiting for the link; callers block once this many are queued.
+REQUEST_QUEUE_SIZE = 32
 
-class UbbinkModbusClient:
-    """Async Modbus client for Ubbink Vigor devices."""
+# Error responses in a row to a fused read before it is read in parts
+# for good; a busy unit may reject a single attempt.
+FUSED_READ_REJECTIONS = 3
+
+# Polls served from the settings cache before the settings are re-read, to
+# pick up changes made on the wall unit or in the app (5 min at 30 s polls)
+STATIC_REFRESH_POLLS = 10
+
+# Input register blocks polled every cycle, as (start, count). They are
+# fetched with one fused read spanning 4020-4115 (96 registers, within the
+# 125-register Modbus limit) and sliced locally; see _read_blocks.
+_INPUT_BLOCKS: tuple[tuple[int, int], ...] = (
+    (REG_ACTIVE_FUNCTION, 5),  # 4020-4024
+    (REG_FAN_INLET_STATUS, 8),  # 4030-4037
+    (REG_FAN_EXHAUST_STATUS, 8),  # 4040-4047
+    (REG_BYPASS_STATUS, 2),  # 4050-4051
+    (REG_PREHEATER_STATUS, 2),  # 4060-4061
+    (REG_FROST_STATUS, 3),  # 4070-4072
+    (REG_FLOW_SWITCH_POSITION, 4),  # 4080-4083
+    (REG_FILTER_STATUS, 1),  # 4100
+    (REG_OPERATING_HOURS_HI, 3),  # 4113-4115
+)
+
+# Holding register blocks with the unit's settings, read fused as
+# 6000-6120 (121 registers) in the same way, or as 6000-6003 and 6100-6120
+# if the unit rejects that.
+_SETTING_BLOCKS: tuple[tuple[int, int], ...] = (
+    (REG_FLOW_PRESET_0, 4),  # 6000-6003
+    (REG_BYPASS_MODE, 3),  # 6100-6102
+    (REG_FILTER_WARNING_DAYS, 1),  # 6120
+)
+
+# Register value decoding
+_TENTHS = 10.0  # temperatures, pressures and humidity are in tenths
+_HUMIDITY_MAX_RAW = 1000  # 100.0 %; higher readings mean no valid value
+_NO_SENSOR = 9999  # dwelling temperature when no sensor is fitted
+_CO2_SENSOR_RUNNING = 4  # CO2 sensor status: running
+
+
+class ModbusTransport:
+    """Physical Modbus link: a local serial port or a TCP bridge.
+
+    Several Vigor units can share one RS-485 bus behind a single bridge,
+    which usually accepts only one connection. Config entries on the same
+    link therefore share one transport, and each request carries the
+    slave ID of the unit it is addressed to.
+    """
+
+    __slots__ = (
+        "_connection_type",
+        "_serial_port",
+        "_baudrate",
+        "_parity",
+        "_host",
+        "_port",
+        "_bridge_type",
+        "_client",
+        "_queue",
+        "_worker",
+        "_closed",
+        "_connect_lock",
+        "_next_request_time",
+        "_request_delay",
+        "_success_streak",
+        "_link_errors",
+        "_responses",
+        "_unpaced_reads",
+    )
 
     def __init__(
         self,
         connection_type: str,
-        slave_id: int = DEFAULT_SLAVE_ID,
         serial_port: str | None = None,
         baudrate: int = DEFAULT_BAUDRATE,
         parity: str = DEFAULT_PARITY,
@@ -99,9 +185,8 @@ class UbbinkModbusClient:
         port: int = DEFAULT_TCP_PORT,
         bridge_type: str = BRIDGE_SER2NET,
     ) -> None:
-        """Initialise the Modbus client."""
+        """Initialise the transport."""
         self._connection_type = connection_type
-        self._slave_id = slave_id
         self._serial_port = serial_port
         self._baudrate = baudrate
         self._parity = parity
@@ -109,12 +194,68 @@ class UbbinkModbusClient:
         self._port = port
         self._bridge_type = bridge_type
         self._client: AsyncModbusSerialClient | AsyncModbusTcpClient | None = None
-        self._lock = asyncio.Lock()
+        # Serialised requests are run one at a time by a worker task
+        self._queue: asyncio.Queue[
+            tuple[Callable[[], Awaitable[Any]], bool, asyncio.Future[Any]]
+        ] = asyncio.Queue(REQUEST_QUEUE_SIZE)
+        self._worker: asyncio.Task[None] | None = None
+        # Set by close() until the next connect; requests then fail at once
+        self._closed = False
+        self._connect_lock = asyncio.Lock()
+        # Loop time before which the next request must not be sent
+        self._next_request_time = 0.0
+        self._request_delay = INITIAL_REQUEST_DELAY
+        self._success_streak = 0
+        # Requests per slave ID that failed on the link itself (timeout,
+        # dropped connection), as opposed to an error response. This relies
+        # on pymodbus raising when no response arrives, which it does from
+        # 3.8 on; 3.7 returned an error response instead.
+        self._link_errors: dict[int, int] = {}
+        # Requests answered by any unit, error responses included
+        self._responses = 0
+        # mbusd paces the serial side itself, so reads over it skip the gap
+        self._unpaced_reads = (
+            connection_type == CONN_TCP and bridge_type == BRIDGE_MBUSD
+        )
+
+    @classmethod
+    def from_config(cls, data: Mapping[str, Any]) -> ModbusTransport:
+        """Create a transport from config entry / config flow data."""
+        return cls(
+            connection_type=data[CONF_CONNECTION_TYPE],
+            serial_port=data.get(CONF_SERIAL_PORT),
+            baudrate=data.get(CONF_SERIAL_BAUDRATE, DEFAULT_BAUDRATE),
+            parity=data.get(CONF_SERIAL_PARITY, DEFAULT_PARITY),
+            host=data.get(CONF_MODBUS_HOST),
+            port=data.get(CONF_MODBUS_PORT, DEFAULT_TCP_PORT),
+            bridge_type=data.get(CONF_TCP_BRIDGE_TYPE, BRIDGE_SER2NET),
+        )
+
+    @property
+    def key(self) -> tuple[Any, ...]:
+        """Return a key identifying the physical link."""
+        if self._connection_type == CONN_SERIAL:
+            return (CONN_SERIAL, self._serial_port, self._baudrate, self._parity)
+        return (CONN_TCP, self._host, self._port, self._bridge_type)
 
     # ──────────── Connection ────────────
 
     async def connect(self) -> bool:
-        """Open the Modbus connection."""
+        """Open the Modbus connection, unless another user already has."""
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            return await self._connect()
+
+    async def reconnect(self) -> bool:
+        """Drop the current connection and open a fresh one."""
+        async with self._connect_lock:
+            await self.close()
+            return await self._connect()
+
+    async def _connect(self) -> bool:
+        """Create the pymodbus client and connect it."""
+        self._closed = False
         try:
             if self._connection_type == CONN_SERIAL:
                 stopbits = 1 if self._parity != "N" else 2
@@ -135,6 +276,8 @@ class UbbinkModbusClient:
                     framer = FramerType.SOCKET
                 else:
                     framer = FramerType.RTU
+                # No need to disable Nagle: asyncio sets TCP_NODELAY on every
+                # TCP connection it opens, so small frames go out at once.
                 self._client = AsyncModbusTcpClient(
                     host=self._host,
                     port=self._port,
@@ -151,217 +294,686 @@ class UbbinkModbusClient:
             return False
 
     async def close(self) -> None:
-        """Close the connection."""
+        """Close the connection and fail any queued requests."""
+        self._closed = True
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+        self._fail_queued()
         if self._client:
             self._client.close()
 
+    def _fail_queued(self) -> None:
+        """Fail every queued request, letting blocked callers queue theirs."""
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(ConnectionError("Modbus connection closed"))
+
     @property
     def connected(self) -> bool:
         """Return True if connected."""
         return self._client is not None and self._client.connected
 
-    # ──────────── Low-level helpers ────────────
+    # ──────────── Requests ────────────
 
-    async def _read_input_registers(self, address: int, count: int = 1) -> list[int] | None:
-        """Read input registers (FC 04)."""
-        async with self._lock:
-            await asyncio.sleep(MIN_REQUEST_DELAY)
+    def link_errors(self, slave: int) -> int:
+        """Return how many requests to a unit have failed on the link."""
+        return self._link_errors.get(slave, 0)
+
+    @property
+    def responses(self) -> int:
+        """Return how many requests any unit on the link has answered."""
+        return self._responses
+
+    def _link_error(self, slave: int) -> None:
+        """Count a request to a unit that got no response."""
+        self._link_errors[slave] = self._link_errors.get(slave, 0) + 1
+
+    async def _wait_for_gap(self) -> None:
+        """Sleep for whatever is left of the gap since the last request.
+
+        A slow device response already counts towards the gap, so
+        back-to-back requests only wait when the previous one was quick.
+        """
+        delay = self._next_request_time - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _request_done(self) -> None:
+        """Start the gap before the next request."""
+        self._next_request_time = (
+            asyncio.get_running_loop().time() + self._request_delay
+        )
+
+    def _adapt_delay(self, ok: bool) -> None:
+        """Widen the request gap after a failure, narrow it after a streak."""
+        if ok:
+            self._success_streak += 1
+            if self._success_streak < REQUEST_DELAY_STREAK:
+                return
+            self._success_streak = 0
+            delay = max(MIN_REQUEST_DELAY, self._request_delay - REQUEST_DELAY_STEP)
+        else:
+            self._success_streak = 0
+            delay = min(MAX_REQUEST_DELAY, self._request_delay * 2)
+        delay = round(delay, 3)
+        if delay != self._request_delay:
+            _LOGGER.debug(
+                "Request gap changed from %.3fs to %.3fs", self._request_delay, delay
+            )
+            self._request_delay = delay
+
+    async def _submit(
+        self, job: Callable[[], Awaitable[Any]], read: bool = False
+    ) -> Any:
+        """Run one request on the link and return its result.
+
+        Requests are queued and run in order by a single worker, spaced by
+        the adaptive request gap, except reads over mbusd, which does the
+        pacing on the serial side.
+        """
+        if self._closed:
+            raise ConnectionError("Modbus connection closed")
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        await self._queue.put((job, not (read and self._unpaced_reads), future))
+        if self._closed:
+            # Closed while this request waited for room in the queue
+            future.cancel()
+            self._fail_queued()
+            raise ConnectionError("Modbus connection closed")
+        if self._worker is None:
+            self._worker = loop.create_task(self._run_queue())
+        result = await future
+        self._responses += 1
+        return result
+
+    async def _run_queue(self) -> None:
+        """Worker: run queued requests one at a time until cancelled."""
+        while True:
+            job, paced, future = await self._queue.get()
+            if future.done():
+                # The caller stopped waiting; don't put it on the wire
+                continue
             try:
-                result = await self._client.read_input_registers(
-                    address=address, count=count, slave=self._slave_id
-                )
-                if result.isError():
-                    _LOGGER.warning("Error reading input register %s: %s", address, result)
-                    return None
-                return list(result.registers)
-            except (ModbusException, asyncio.TimeoutError, ConnectionError) as exc:
-                _LOGGER.warning("Modbus read input registers %s failed: %s", address, exc)
+                if paced:
+                    await self._wait_for_gap()
+                result = await job()
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.set_exception(ConnectionError("Modbus connection closed"))
+                raise
+            except Exception as exc:
+                self._adapt_delay(False)
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                # Error responses count too: the unit kept up with the pace
+                self._adapt_delay(True)
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._request_done()
+
+    async def read_input_registers(
+        self, slave: int, address: int, count: int = 1
+    ) -> Sequence[int] | None:
+        """Read input registers (FC 04)."""
+        try:
+            result = await self._submit(
+                lambda: self._client.read_input_registers(
+                    address=address, count=count, slave=slave
+                ),
+                read=True,
+            )
+            if result.isError():
+                _LOGGER.warning("Error reading input register %s: %s", address, result)
                 return None
+            return result.registers
+        except (ModbusException, asyncio.TimeoutError, ConnectionError) as exc:
+            self._link_error(slave)
+            _LOGGER.warning("Modbus read input registers %s failed: %s", address, exc)
+            return None
 
-    async def _read_holding_registers(self, address: int, count: int = 1) -> list[int] | None:
+    async def read_holding_registers(
+        self, slave: int, address: int, count: int = 1
+    ) -> Sequence[int] | None:
         """Read holding registers (FC 03)."""
-        async with self._lock:
-            await asyncio.sleep(MIN_REQUEST_DELAY)
-            try:
-                result = await self._client.read_holding_registers(
-                    address=address, count=count, slave=self._slave_id
-                )
-                if result.isError():
-                    _LOGGER.warning("Error reading holding register %s: %s", address, result)
-                    return None
-                return list(result.registers)
-            except (ModbusException, asyncio.TimeoutError, ConnectionError) as exc:
-                _LOGGER.warning("Modbus read holding registers %s failed: %s", address, exc)
+        try:
+            result = await self._submit(
+                lambda: self._client.read_holding_registers(
+                    address=address, count=count, slave=slave
+                ),
+                read=True,
+            )
+            if result.isError():
+                _LOGGER.warning("Error reading holding register %s: %s", address, result)
                 return None
+            return result.registers
+        except (ModbusException, asyncio.TimeoutError, ConnectionError) as exc:
+            self._link_error(slave)
+            _LOGGER.warning("Modbus read holding registers %s failed: %s", address, exc)
+            return None
 
-    async def _write_register(self, address: int, value: int) -> bool:
+    async def write_register(self, slave: int, address: int, value: int) -> bool:
         """Write a single holding register (FC 06)."""
-        async with self._lock:
-            await asyncio.sleep(MIN_REQUEST_DELAY)
-            try:
-                result = await self._client.write_register(
-                    address=address, value=value, slave=self._slave_id
+        try:
+            result = await self._submit(
+                lambda: self._client.write_register(
+                    address=address, value=value, slave=slave
+                )
+            )
+            if result.isError():
+                _LOGGER.error("Error writing register %s=%s: %s", address, value, result)
+                return False
+            return True
+        except (ModbusException, asyncio.TimeoutError, ConnectionError) as exc:
+            self._link_error(slave)
+            _LOGGER.error("Modbus write register %s failed: %s", address, exc)
+            return False
+
+    async def write_registers(
+        self, slave: int, address: int, values: list[int]
+    ) -> bool:
+        """Write consecutive holding registers (FC 16)."""
+        try:
+            result = await self._submit(
+                lambda: self._client.write_registers(
+                    address=address, values=values, slave=slave
                 )
-                if result.isError():
-                    _LOGGER.error("Error writing register %s=%s: %s", address, value, result)
-                    return False
+            )
+            if result.isError():
+                _LOGGER.warning(
+                    "Error writing registers %s=%s: %s", address, values, result
+                )
+                return False
+            return True
+        except (ModbusException, asyncio.TimeoutError, ConnectionError) as exc:
+            self._link_error(slave)
+            _LOGGER.error("Modbus write registers %s failed: %s", address, exc)
+            return False
+
+
+class UbbinkModbusClient:
+    """Async Modbus client for one Ubbink Vigor unit."""
+
+    __slots__ = (
+        "_transport",
+        "_slave_id",
+        "_read_ir",
+        "_read_hr",
+        "_write_r",
+        "_write_rs",
+        "_link_errors",
+        "_link_suspect",
+        "_responses_seen",
+        "_fuse_rejections",
+        "_multi_write",
+        "_switch_position",
+        "_serial_number",
+        "_static_cache",
+        "_static_dirty",
+        "_static_writes",
+        "_static_age",
+    )
+
+    def __init__(
+        self, transport: ModbusTransport, slave_id: int = DEFAULT_SLAVE_ID
+    ) -> None:
+        """Initialise the Modbus client."""
+        self._transport = transport
+        self._slave_id = slave_id
+        # Transport requests with this unit's slave ID bound in. The bound
+        # methods outlive reconnects, which only swap the pymodbus client.
+        self._read_ir = partial(transport.read_input_registers, slave_id)
+        self._read_hr = partial(transport.read_holding_registers, slave_id)
+        self._write_r = partial(transport.write_register, slave_id)
+        self._write_rs = partial(transport.write_registers, slave_id)
+        self._link_errors = partial(transport.link_errors, slave_id)
+        # Set when a poll fails; the next ensure_connected() probes the link
+        # before deciding whether to reconnect.
+        self._link_suspect = False
+        # Link-wide response count when this unit was last found failing
+        self._responses_seen = 0
+        # Error responses in a row to fused reads, by (start, count) span
+        self._fuse_rejections: dict[tuple[int, int], int] = {}
+        # Cleared if the unit turns out not to support FC 16
+        self._multi_write = True
+        # Switch position (8001) from the last poll, rewritten unchanged
+        # when a flow rate write spans 8000-8002
+        self._switch_position: int | None = None
+        # Settings that rarely change (presets, bypass, filter days) are
+        # cached until a write marks them dirty, or for STATIC_REFRESH_POLLS
+        # polls. Writes are counted so a poll that read the settings before a
+        # write landed does not mark the cache clean. The serial number never
+        # changes, so it is read once.
+        self._serial_number: str | None = None
+        self._static_cache: dict[str, Any] = {}
+        self._static_dirty = True
+        self._static_writes = 0
+        self._static_age = 0
+
+    @classmethod
+    def from_config(cls, data: Mapping[str, Any]) -> UbbinkModbusClient:
+        """Create a client, with its own transport, from config data."""
+        return cls(
+            ModbusTransport.from_config(data),
+            data.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID),
+        )
+
+    @property
+    def transport(self) -> ModbusTransport:
+        """Return the link this client talks over."""
+        return self._transport
+
+    @property
+    def slave_id(self) -> int:
+        """Return the Modbus slave ID of the unit."""
+        return self._slave_id
+
+    @property
+    def connection_key(self) -> tuple[Any, ...]:
+        """Return a key identifying the physical link this client talks over."""
+        return self._transport.key
+
+    # ──────────── Connection ────────────
+
+    async def connect(self) -> bool:
+        """Open the Modbus connection."""
+        return await self._transport.connect()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        await self._transport.close()
+
+    @property
+    def connected(self) -> bool:
+        """Return True if connected."""
+        return self._transport.connected
+
+    async def ensure_connected(self) -> bool:
+        """Make sure the link is usable, reconnecting only when it is not.
+
+        After a failed poll the open connection is probed with a single
+        register read. Any answer, an error response included, shows the
+        unit is alive. If the probe gets no response, the link is only torn
+        down when no other unit on it has answered in the meantime: the link
+        may be shared, and one unit that is switched off must not cut the
+        others off. Healthy polls skip the probe, so a transient read error
+        costs no reconnect.
+        """
+        if self.connected:
+            if not self._link_suspect:
+                return True
+            errors = self._link_errors()
+            await self._read_input_registers(REG_SW_VERSION_TYPE, 1)
+            if self._link_errors() == errors:
+                self._link_suspect = False
                 return True
-            except (ModbusException, asyncio.TimeoutError, ConnectionError) as exc:
-                _LOGGER.error("Modbus write register %s failed: %s", address, exc)
+            if self._transport.responses != self._responses_seen:
+                _LOGGER.debug(
+                    "Ubbink Vigor unit %s not answering, other units on the link are",
+                    self._slave_id,
+                )
+                self._responses_seen = self._transport.responses
                 return False
+            _LOGGER.debug("Liveness probe failed, reconnecting to Ubbink Vigor")
+            ok = await self._transport.reconnect()
+        else:
+            ok = await self._transport.connect()
+        if ok:
+            self._link_suspect = False
+        return ok
 
-    # ──────────── Signed value helper ────────────
+    # ──────────── Low-level helpers ────────────
+
+    def _mark_suspect(self) -> None:
+        """Have the next ensure_connected() probe the link before polling."""
+        self._link_suspect = True
+        self._responses_seen = self._transport.responses
+
+    async def _read_input_registers(self, address: int, count: int = 1) -> Sequence[int] | None:
+        """Read input registers (FC 04) from this unit."""
+        return await self._read_ir(address, count)
+
+    async def _read_holding_registers(self, address: int, count: int = 1) -> Sequence[int] | None:
+        """Read holding registers (FC 03) from this unit."""
+        return await self._read_hr(address, count)
+
+    async def _write_register(self, address: int, value: int) -> bool:
+        """Write a single holding register (FC 06) on this unit."""
+        return await self._write_r(address, value)
+
+    async def _write_registers(self, address: int, values: list[int]) -> bool:
+        """Write consecutive holding registers (FC 16) on this unit."""
+        return await self._write_rs(address, values)
+
+    async def _write_block(self, address: int, values: list[int]) -> bool:
+        """Write consecutive registers in one request, if the unit allows it.
+
+        If the unit answers the FC 16 write with an error response, it does
+        not support FC 16: the block, and every later one, is written as one
+        FC 06 write per register. A timeout is just a failed write.
+        """
+        if self._multi_write:
+            errors = self._link_errors()
+            if await self._write_registers(address, values):
+                return True
+            if self._link_errors() != errors:
+                return False
+            _LOGGER.info("Unit rejected a multi-register write, using single writes")
+            self._multi_write = False
+        for offset, value in enumerate(values):
+            if not await self._write_register(address + offset, value):
+                return False
+        return True
+
+    async def _write_static(self, address: int, value: int) -> bool:
+        """Write a cached setting register and re-read the settings next poll."""
+        ok = await self._write_register(address, value)
+        if ok:
+            self._static_dirty = True
+            self._static_writes += 1
+        return ok
+
+    async def _read_blocks(
+        self,
+        read: Callable[[int, int], Awaitable[Sequence[int] | None]],
+        blocks: tuple[tuple[int, int], ...],
+    ) -> list[Sequence[int] | None]:
+        """Read several register blocks, fused into one request if possible.
+
+        The span from the first to the last block is read at once and sliced
+        locally. Some firmware rejects reads covering undocumented gaps: if
+        the span gets an error response, the blocks are split at the widest
+        gap between them and each part is read the same way, down to single
+        blocks; if the first part fails too, the rest is not tried. Once a
+        span has been rejected FUSED_READ_REJECTIONS times in a row while its
+        parts could be read, it is not tried again.
+        """
+        if len(blocks) == 1:
+            return [await read(*blocks[0])]
+        start = blocks[0][0]
+        last, last_count = blocks[-1]
+        span = (start, last + last_count - start)
+        rejections = self._fuse_rejections.get(span, 0)
+        errors = self._link_errors()
+        if rejections < FUSED_READ_REJECTIONS:
+            regs = await read(*span)
+            if regs is not None:
+                if rejections:
+                    del self._fuse_rejections[span]
+                return [regs[a - start : a - start + n] for a, n in blocks]
+            if self._link_errors() != errors:
+                return [None] * len(blocks)
+        # e.g. 6000-6120 splits into 6000-6003 and 6100-6120
+        split = max(
+            range(1, len(blocks)), key=lambda i: blocks[i][0] - sum(blocks[i - 1])
+        )
+        results = await self._read_blocks(read, blocks[:split])
+        if not any(results):
+            # The unit rejects more than the span, or the link is down
+            return [None] * len(blocks)
+        results += await self._read_blocks(read, blocks[split:])
+        if rejections < FUSED_READ_REJECTIONS:
+            # Parts of the span read fine, so the unit rejected the span itself
+            rejections += 1
+            self._fuse_rejections[span] = rejections
+            if rejections == FUSED_READ_REJECTIONS:
+                _LOGGER.debug(
+                    "Fused read of %s registers from %s rejected, reading it in parts",
+                    span[1],
+                    start,
+                )
+        return results
+
+    async def _run_reads(self, *reads: Callable[[], Awaitable[Any]]) -> list[Any]:
+        """Run independent reads in order.
+
+        The reads stop at the first one that fails on the link rather than
+        with an error response, since the rest would only time out as well;
+        their results are None.
+        """
+        errors = self._link_errors()
+        results: list[Any] = []
+        for read in reads:
+            if self._link_errors() != errors:
+                results.append(None)
+            else:
+                results.append(await read())
+        return results
+
+    @staticmethod
+    async def _skip_read() -> None:
+        """Stand in for a read whose result is already cached."""
+        return None
+
+    # ──────────── Value helpers ────────────
 
     @staticmethod
     def _to_signed(value: int) -> int:
         """Convert unsigned 16-bit to signed."""
-        if value >= 0x8000:
-            return value - 0x10000
-        return value
+        return (value ^ 0x8000) - 0x8000
+
+    @classmethod
+    def _tenths(cls, value: int) -> float:
+        """Scale a signed register in tenths (°C, Pa) to its value."""
+        return round(cls._to_signed(value) / _TENTHS, 1)
+
+    @staticmethod
+    def _humidity(value: int) -> float | None:
+        """Scale a humidity register in tenths of %, None when out of range."""
+        return round(value / _TENTHS, 1) if value <= _HUMIDITY_MAX_RAW else None
+
+    @staticmethod
+    def _clamp(value: int, low: int, high: int) -> int:
+        """Limit a value to the range a register accepts."""
+        return value if low <= value <= high else (low if value < low else high)
+
+    @staticmethod
+    def _lookup(table: tuple[str | None, ...], value: int) -> str:
+        """Map a raw enum register value to its label."""
+        if value < len(table):
+            label = table[value]
+            if label is not None:
+                return label
+        return f"Unknown ({value})"
 
     # ──────────── Read all data at once ────────────
 
     async def read_all_data(self) -> dict[str, Any] | None:
         """Read all relevant registers and return a parsed dict."""
         data: dict[str, Any] = {}
+        static: dict[str, Any] = {}
+        read_serial = self._serial_number is None
+        read_static = self._static_dirty or self._static_age >= STATIC_REFRESH_POLLS
+        static_writes = self._static_writes
+        skip = self._skip_read
+
+        errors = self._link_errors()
+        (
+            input_blocks,
+            co2_regs,
+            error_regs,
+            serial_regs,
+            setting_blocks,
+            remote_regs,
+        ) = await self._run_reads(
+            partial(self._read_blocks, self._read_input_registers, _INPUT_BLOCKS),
+            partial(self._read_input_registers, REG_CO2_SENSOR1_VALUE - 1, 4),
+            partial(self._read_input_registers, REG_SYSTEM_ERROR_STATUS, 2),
+            partial(self._read_input_registers, REG_SERIAL_0, 3)
+            if read_serial
+            else skip,
+            partial(self._read_blocks, self._read_holding_registers, _SETTING_BLOCKS)
+            if read_static
+            else skip,
+            partial(self._read_holding_registers, REG_MODBUS_CONTROL, 4),
+        )
+        if self._link_errors() != errors:
+            # Partial data from a failing link is not worth publishing
+            self._mark_suspect()
+            return None
 
-        # ── Input registers: batch read where possible ──
+        # ── Input registers: fused block, consumed in _INPUT_BLOCKS order ──
+        blocks = iter(input_blocks)
 
         # Batch 1: Registers 4020-4024 (active function, vent mode, pressures)
-        regs = await self._read_input_registers(REG_ACTIVE_FUNCTION, 5)
+        regs = next(blocks)
         if regs is None:
+            self._mark_suspect()
             return None  # If we can't read basic data, bail out
-        data["active_function"] = ACTIVE_FUNCTION_MAP.get(regs[0], f"Unknown ({regs[0]})")
-        data["active_function_raw"] = regs[0]
+        data["active_function"] = self._lookup(ACTIVE_FUNCTION_TABLE, regs[0])
         data["fan_control_type"] = regs[1]
-        data["ventilation_mode"] = VENTILATION_MODE_MAP.get(regs[2], f"Unknown ({regs[2]})")
-        data["ventilation_mode_raw"] = regs[2]
-        data["supply_pressure"] = round(self._to_signed(regs[3]) / 10.0, 1)
-        data["exhaust_pressure"] = round(self._to_signed(regs[4]) / 10.0, 1)
+        data["ventilation_mode"] = self._lookup(VENTILATION_MODE_TABLE, regs[2])
+        data["supply_pressure"] = self._tenths(regs[3])
+        data["exhaust_pressure"] = self._tenths(regs[4])
 
         # Batch 2: Registers 4030-4037 (supply fan block)
-        regs = await self._read_input_registers(REG_FAN_INLET_STATUS, 8)
+        regs = next(blocks)
         if regs:
-            data["fan_inlet_status"] = FAN_STATUS_MAP.get(regs[0], f"Unknown ({regs[0]})")
+            data["fan_inlet_status"] = self._lookup(FAN_STATUS_TABLE, regs[0])
             data["supply_airflow_setpoint"] = regs[1]
             data["supply_airflow_actual"] = regs[2]
             data["supply_massflow"] = regs[3]
             data["supply_fan_speed"] = regs[4]
             # reg[5] is 4035 (anemometer), skip
-            data["supply_fan_temperature"] = round(self._to_signed(regs[6]) / 10.0, 1)
-            data["supply_fan_humidity"] = round(regs[7] / 10.0, 1) if regs[7] <= 1000 else None
+            data["supply_fan_temperature"] = self._tenths(regs[6])
+            data["supply_fan_humidity"] = self._humidity(regs[7])
 
         # Batch 3: Registers 4040-4047 (exhaust fan block)
-        regs = await self._read_input_registers(REG_FAN_EXHAUST_STATUS, 8)
+        regs = next(blocks)
         if regs:
-            data["fan_exhaust_status"] = FAN_STATUS_MAP.get(regs[0], f"Unknown ({regs[0]})")
+            data["fan_exhaust_status"] = self._lookup(FAN_STATUS_TABLE, regs[0])
             # 4041 = exhaust setpoint (not in doc explicitly)
             data["exhaust_airflow_actual"] = regs[2]
             # 4043 = exhaust massflow
             data["exhaust_fan_speed"] = regs[4]
             # reg[5] = 4045 exhaust anemometer
-            data["exhaust_fan_temperature"] = round(self._to_signed(regs[6]) / 10.0, 1)
-            data["exhaust_fan_humidity"] = round(regs[7] / 10.0, 1) if regs[7] <= 1000 else None
+            data["exhaust_fan_temperature"] = self._tenths(regs[6])
+            data["exhaust_fan_humidity"] = self._humidity(regs[7])
 
         # Batch 4: Bypass status (4050-4051)
-        regs = await self._read_input_registers(REG_BYPASS_STATUS, 2)
+        regs = next(blocks)
         if regs:
-            data["bypass_status"] = BYPASS_STATUS_MAP.get(regs[0], f"Unknown ({regs[0]})")
-            data["bypass_status_raw"] = regs[0]
+            data["bypass_status"] = self._lookup(BYPASS_STATUS_TABLE, regs[0])
             data["bypass_step_position"] = regs[1]
 
         # Batch 5: Preheater (4060-4061)
-        regs = await self._read_input_registers(REG_PREHEATER_STATUS, 2)
+        regs = next(blocks)
         if regs:
-            data["preheater_status"] = PREHEATER_STATUS_MAP.get(regs[0], f"Unknown ({regs[0]})")
+            data["preheater_status"] = self._lookup(PREHEATER_STATUS_TABLE, regs[0])
             data["preheater_capacity"] = regs[1]
 
         # Batch 6: Frost (4070-4072)
-        regs = await self._read_input_registers(REG_FROST_STATUS, 3)
+        regs = next(blocks)
         if regs:
             data["frost_status_raw"] = regs[0]
             data["frost_heater_power"] = regs[1]
             data["frost_fan_reduction"] = regs[2]
 
         # Batch 7: Temperatures and humidity (4080-4083)
-        regs = await self._read_input_registers(REG_OUTSIDE_TEMP - 1, 4)
+        regs = next(blocks)
         if regs:
             data["flow_switch_position"] = regs[0]
-            data["outside_temperature"] = round(self._to_signed(regs[1]) / 10.0, 1)
-            val = self._to_signed(regs[2])
-            if val != 9999:
-                data["dwelling_temperature"] = round(val / 10.0, 1)
-            else:
-                data["dwelling_temperature"] = None
-            data["rht_humidity"] = round(regs[3] / 10.0, 1) if regs[3] <= 1000 else None
+            data["outside_temperature"] = self._tenths(regs[1])
+            data["dwelling_temperature"] = (
+                self._tenths(regs[2]) if regs[2] != _NO_SENSOR else None
+            )
+            data["rht_humidity"] = self._humidity(regs[3])
 
         # Filter status (4100)
-        regs = await self._read_input_registers(REG_FILTER_STATUS, 1)
+        regs = next(blocks)
         if regs:
-            data["filter_status"] = FILTER_STATUS_MAP.get(regs[0], f"Unknown ({regs[0]})")
+            data["filter_status"] = self._lookup(FILTER_STATUS_TABLE, regs[0])
 
         # Operating hours (4113-4115), two 16-bit words = 32-bit for hours
-        regs = await self._read_input_registers(REG_OPERATING_HOURS_HI, 3)
+        regs = next(blocks)
         if regs:
             data["operating_hours"] = (regs[0] << 16) | regs[1]
             data["filter_hours"] = regs[2]
 
         # CO2 sensors (4200-4203)
-        regs = await self._read_input_registers(REG_CO2_SENSOR1_VALUE - 1, 4)
+        regs = co2_regs
         if regs:
-            if regs[0] == 4:  # Running
+            if regs[0] == _CO2_SENSOR_RUNNING:
                 data["co2_sensor1"] = regs[1]
             else:
                 data["co2_sensor1"] = None
-            if regs[2] == 4:  # Running
+            if regs[2] == _CO2_SENSOR_RUNNING:
                 data["co2_sensor2"] = regs[3]
             else:
                 data["co2_sensor2"] = None
 
         # Error status (4800-4801)
-        regs = await self._read_input_registers(REG_SYSTEM_ERROR_STATUS, 2)
+        regs = error_regs
         if regs:
-            data["system_error"] = SYSTEM_ERROR_MAP.get(regs[0], f"Unknown ({regs[0]})")
-            data["system_error_raw"] = regs[0]
+            data["system_error"] = self._lookup(SYSTEM_ERROR_TABLE, regs[0])
             data["active_incident"] = regs[1] if regs[1] != 0 else None
 
         # Serial number (4010-4012)
-        regs = await self._read_input_registers(REG_SERIAL_0, 3)
+        regs = serial_regs
         if regs:
-            # BCD encoded digits
-            serial = ""
-            for reg in regs:
-                serial += f"{(reg >> 12) & 0xF}{(reg >> 8) & 0xF}{(reg >> 4) & 0xF}{reg & 0xF}"
-            data["serial_number"] = serial
+            # BCD encoded digits: each nibble is one decimal digit, so the
+            # big-endian hex dump of the registers is the serial itself.
+            serial = struct.pack(f">{len(regs)}H", *regs).hex()
+            if not serial.isdigit():
+                # Not valid BCD: spell nibbles above 9 in decimal, as older
+                # versions did, so unique IDs stay the same
+                serial = "".join(str(int(nibble, 16)) for nibble in serial)
+            self._serial_number = serial
+        if self._serial_number is not None:
+            data["serial_number"] = self._serial_number
 
-        # ── Holding registers ──
+        # ── Holding registers: settings consumed in _SETTING_BLOCKS order ──
+        preset_regs, bypass_regs, filter_days_regs = setting_blocks or (None,) * 3
 
         # Flow presets (6000-6003)
-        regs = await self._read_holding_registers(REG_FLOW_PRESET_0, 4)
+        regs = preset_regs
         if regs:
-            data["flow_preset_holiday"] = regs[0]
-            data["flow_preset_low"] = regs[1]
-            data["flow_preset_normal"] = regs[2]
-            data["flow_preset_high"] = regs[3]
+            static["flow_preset_holiday"] = regs[0]
+            static["flow_preset_low"] = regs[1]
+            static["flow_preset_normal"] = regs[2]
+            static["flow_preset_high"] = regs[3]
 
         # Bypass mode (6100-6102)
-        regs = await self._read_holding_registers(REG_BYPASS_MODE, 3)
+        regs = bypass_regs
         if regs:
-            data["bypass_mode"] = BYPASS_MODE_MAP.get(regs[0], f"Unknown ({regs[0]})")
-            data["bypass_mode_raw"] = regs[0]
-            data["bypass_temp_dwelling"] = round(self._to_signed(regs[1]) / 10.0, 1)
-            data["bypass_temp_outside"] = round(self._to_signed(regs[2]) / 10.0, 1)
+            static["bypass_mode"] = self._lookup(BYPASS_MODE_TABLE, regs[0])
+            static["bypass_temp_dwelling"] = self._tenths(regs[1])
+            static["bypass_temp_outside"] = self._tenths(regs[2])
 
         # Filter warning days (6120)
-        regs = await self._read_holding_registers(REG_FILTER_WARNING_DAYS, 1)
+        regs = filter_days_regs
         if regs:
-            data["filter_warning_days"] = regs[0]
+            static["filter_warning_days"] = regs[0]
+
+        if read_static:
+            # Only trust the cache once every static block has been read,
+            # and no write has landed since the read may have been issued
+            if (
+                preset_regs
+                and bypass_regs
+                and filter_days_regs
+                and self._static_writes == static_writes
+            ):
+                self._static_cache = static
+                self._static_dirty = False
+                self._static_age = 0
+            data.update(static)
+        else:
+            self._static_age += 1
+            data.update(self._static_cache)
 
         # Remote control status (8000-8003)
-        regs = await self._read_holding_registers(REG_MODBUS_CONTROL, 4)
+        regs = remote_regs
         if regs:
             data["modbus_control"] = regs[0]
             data["switch_position"] = regs[1]
+            self._switch_position = regs[1]
             data["desired_flow_rate"] = regs[2]
             data["standby_status"] = regs[3]
 
@@ -369,7 +981,11 @@ class UbbinkModbusClient:
             if regs[0] == 0:
                 data["airflow_mode"] = "wall_unit"
             elif regs[0] == 1:
-                data["airflow_mode"] = SWITCH_TO_AIRFLOW_MODE.get(regs[1], "unknown")
+                data["airflow_mode"] = (
+                    AIRFLOW_MODES_BY_SWITCH[regs[1]]
+                    if regs[1] < len(AIRFLOW_MODES_BY_SWITCH)
+                    else "unknown"
+                )
             elif regs[0] == 2:
                 data["airflow_mode"] = "custom"
             else:
@@ -388,21 +1004,25 @@ class UbbinkModbusClient:
             return await self._write_register(REG_MODBUS_CONTROL, 0)
 
         if mode in AIRFLOW_MODE_TO_SWITCH:
-            # Enable Modbus switch control
-            ok = await self._write_register(REG_MODBUS_CONTROL, 1)
-            if not ok:
-                return False
-            return await self._write_register(
-                REG_SWITCH_POSITION, AIRFLOW_MODE_TO_SWITCH[mode]
-            )
+            # Enable Modbus switch control and set the position (8000-8001)
+            switch = AIRFLOW_MODE_TO_SWITCH[mode]
+            ok = await self._write_block(REG_MODBUS_CONTROL, [1, switch])
+            if ok:
+                self._switch_position = switch
+            return ok
 
         _LOGGER.error("Invalid airflow mode: %s", mode)
         return False
 
     async def set_custom_flow_rate(self, rate: int) -> bool:
         """Set a custom flow rate in m³/h."""
-        rate = max(0, min(rate, 400))
-        # Enable Modbus flow rate control
+        rate = self._clamp(rate, 0, 400)
+        if self._switch_position is not None:
+            # Enable Modbus flow rate control and set the rate (8000-8002)
+            return await self._write_block(
+                REG_MODBUS_CONTROL, [2, self._switch_position, rate]
+            )
+        # Switch position not polled yet, so leave 8001 untouched
         ok = await self._write_register(REG_MODBUS_CONTROL, 2)
         if not ok:
             return False
@@ -410,11 +1030,10 @@ class UbbinkModbusClient:
 
     async def set_bypass_mode(self, mode: str) -> bool:
         """Set bypass mode: 'Automatic', 'Closed', 'Open'."""
-        from .const import BYPASS_MODE_REVERSE
         if mode not in BYPASS_MODE_REVERSE:
             _LOGGER.error("Invalid bypass mode: %s", mode)
             return False
-        return await self._write_register(REG_BYPASS_MODE, BYPASS_MODE_REVERSE[mode])
+        return await self._write_static(REG_BYPASS_MODE, BYPASS_MODE_REVERSE[mode])
 
     async def reset_filter(self) -> bool:
         """Reset the filter warning."""
@@ -430,15 +1049,13 @@ class UbbinkModbusClient:
 
     async def set_bypass_temp_dwelling(self, temp: float) -> bool:
         """Set bypass dwelling temperature threshold (°C)."""
-        value = int(temp * 10)
-        value = max(150, min(350, value))
-        return await self._write_register(REG_BYPASS_TEMP_DWELLING, value)
+        value = self._clamp(int(temp * 10), 150, 350)
+        return await self._write_static(REG_BYPASS_TEMP_DWELLING, value)
 
     async def set_bypass_temp_outside(self, temp: float) -> bool:
         """Set bypass outside temperature threshold (°C)."""
-        value = int(temp * 10)
-        value = max(70, min(150, value))
-        return await self._write_register(REG_BYPASS_TEMP_OUTSIDE, value)
+        value = self._clamp(int(temp * 10), 70, 150)
+        return await self._write_static(REG_BYPASS_TEMP_OUTSIDE, value)
 
     # ──────────── Test connection ────────────
 
@@ -446,3 +1063,8 @@ class UbbinkModbusClient:
         """Test by reading a register."""
         regs = await self._read_input_registers(REG_ACTIVE_FUNCTION, 1)
         return regs is not None
+
+    async def read_identity(self) -> int | None:
+        """Read the software version/type register (4000)."""
+        regs = await self._read_input_registers(REG_SW_VERSION_TYPE, 1)
+        return regs[0] if regs else None
@@ -4,11 +4,10 @@ from __future__ import annotations
 import logging
 
 from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from . import UbbinkVigorConfigEntry
 from .coordinator import UbbinkVigorCoordinator
 from .entity import UbbinkVigorEntity
 
@@ -17,11 +16,11 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: UbbinkVigorConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up number entities."""
-    coordinator: UbbinkVigorCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     entities: list[NumberEntity] = [
         UbbinkFlowRateNumber(coordinator),
         UbbinkBypassTempDwellingNumber(coordinator),
@@ -67,7 +66,13 @@ class UbbinkFlowRateNumber(UbbinkVigorEntity, NumberEntity):
         ok = await self.coordinator.client.set_custom_flow_rate(int(value))
         if ok:
             _LOGGER.debug("Flow rate set to %s m³/h", value)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_apply_write(
+                {
+                    "modbus_control": 2,
+                    "desired_flow_rate": int(value),
+                    "airflow_mode": "custom",
+                }
+            )
         else:
             _LOGGER.error("Failed to set flow rate to %s", value)
 
@@ -103,7 +108,7 @@ class UbbinkBypassTempDwellingNumber(UbbinkVigorEntity, NumberEntity):
         """Set the value."""
         ok = await self.coordinator.client.set_bypass_temp_dwelling(value)
         if ok:
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_apply_write({"bypass_temp_dwelling": value})
 
 
 class UbbinkBypassTempOutsideNumber(UbbinkVigorEntity, NumberEntity):
@@ -136,4 +141,4 @@ class UbbinkBypassTempOutsideNumber(UbbinkVigorEntity, NumberEntity):
         """Set the value."""
         ok = await self.coordinator.client.set_bypass_temp_outside(value)
         if ok:
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_apply_write({"bypass_temp_outside": value})
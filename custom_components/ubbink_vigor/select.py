@@ -4,11 +4,11 @@ from __future__ import annotations
 import logging
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import AIRFLOW_MODE_OPTIONS, BYPASS_MODE_OPTIONS, DOMAIN
+from . import UbbinkVigorConfigEntry
+from .const import AIRFLOW_MODE_OPTIONS, BYPASS_MODE_OPTIONS
 from .coordinator import UbbinkVigorCoordinator
 from .entity import UbbinkVigorEntity
 
@@ -17,11 +17,11 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: UbbinkVigorConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up select entities."""
-    coordinator: UbbinkVigorCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     entities: list[SelectEntity] = [
         UbbinkAirflowModeSelect(coordinator),
         UbbinkBypassModeSelect(coordinator),
@@ -59,7 +59,12 @@ class UbbinkAirflowModeSelect(UbbinkVigorEntity, SelectEntity):
         ok = await self.coordinator.client.set_airflow_mode(option)
         if ok:
             _LOGGER.debug("Airflow mode set to %s", option)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_apply_write(
+                {
+                    "airflow_mode": option,
+                    "modbus_control": 0 if option == "wall_unit" else 1,
+                }
+            )
         else:
             _LOGGER.error("Failed to set airflow mode to %s", option)
 
@@ -94,6 +99,6 @@ class UbbinkBypassModeSelect(UbbinkVigorEntity, SelectEntity):
         ok = await self.coordinator.client.set_bypass_mode(option)
         if ok:
             _LOGGER.debug("Bypass mode set to %s", option)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_apply_write({"bypass_mode": option})
         else:
             _LOGGER.error("Failed to set bypass mode to %s", option)
@@ -10,7 +10,6 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     REVOLUTIONS_PER_MINUTE,
@@ -19,10 +18,10 @@ from homeassistant.const import (
     UnitOfTime,
     UnitOfVolumeFlowRate,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from . import UbbinkVigorConfigEntry
 from .coordinator import UbbinkVigorCoordinator
 from .entity import UbbinkVigorEntity
 
@@ -301,22 +300,27 @@ SENSOR_DESCRIPTIONS: tuple[UbbinkSensorDescription, ...] = (
     ),
 )
 
+# Descriptions paired with the coordinator data key they read, in declaration
+# order; several descriptions may read the same key
+_DESCRIPTIONS_WITH_DATA_KEY: tuple[tuple[str, UbbinkSensorDescription], ...] = tuple(
+    (desc.data_key, desc) for desc in SENSOR_DESCRIPTIONS
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: UbbinkVigorConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensors."""
-    coordinator: UbbinkVigorCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[UbbinkVigorSensor] = []
-
-    for desc in SENSOR_DESCRIPTIONS:
-        # Only add sensor if data key exists in coordinator data
-        if desc.data_key in coordinator.data:
-            entities.append(UbbinkVigorSensor(coordinator, desc))
-
-    async_add_entities(entities)
+    coordinator = entry.runtime_data
+    data = coordinator.data
+    # Only add sensors whose data key exists in coordinator data
+    async_add_entities(
+        _make_sensor(coordinator, desc)
+        for data_key, desc in _DESCRIPTIONS_WITH_DATA_KEY
+        if data_key in data
+    )
 
 
 class UbbinkVigorSensor(UbbinkVigorEntity, SensorEntity):
@@ -330,11 +334,43 @@ class UbbinkVigorSensor(UbbinkVigorEntity, SensorEntity):
         """Initialise the sensor."""
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        self._data_key = description.data_key
+        self._attr_native_value = self._current_value()
+
+    def _current_value(self) -> Any:
+        """Return the sensor value from the latest coordinator data."""
+        return self.coordinator.data.get(self._data_key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the value from the new data, then write the state."""
+        self._attr_native_value = self._current_value()
+        super()._handle_coordinator_update()
+
+
+class UbbinkVigorTransformedSensor(UbbinkVigorSensor):
+    """Sensor entity whose value is passed through the description's value_fn."""
 
-    @property
-    def native_value(self) -> Any:
-        """Return the sensor value."""
-        value = self.coordinator.data.get(self.entity_description.data_key)
-        if self.entity_description.value_fn and value is not None:
-            return self.entity_description.value_fn(value)
+    def __init__(
+        self, coordinator: UbbinkVigorCoordinator, description: UbbinkSensorDescription
+    ) -> None:
+        """Initialise the sensor."""
+        # Set before the base class computes the first value
+        self._value_fn = description.value_fn
+        super().__init__(coordinator, description)
+
+    def _current_value(self) -> Any:
+        """Return the transformed sensor value from the latest data."""
+        value = self.coordinator.data.get(self._data_key)
+        if value is not None:
+            return self._value_fn(value)
         return value
+
+
+def _make_sensor(
+    coordinator: UbbinkVigorCoordinator, description: UbbinkSensorDescription
+) -> UbbinkVigorSensor:
+    """Create a sensor, using the transforming class only when needed."""
+    if description.value_fn is None:
+        return UbbinkVigorSensor(coordinator, description)
+    return UbbinkVigorTransformedSensor(coordinator, description)